@@ -10,6 +10,7 @@ from typing import (
     cast,
     Any,
     Callable,
+    Dict,
     Generic,
     Iterator,
     List,
@@ -39,15 +40,15 @@ class Located:
     Attributes:
       line_span (:class:`Tuple[int, int]`): Lines spanned by a node
       column_span (:class:`Tuple[int, int]`): Columns spanned by a node
+
+    Both attributes default to a shared class-level :data:`(-1, -1)`
+    and are only stored on an instance through :meth:`located_on`,
+    sparing unlocated nodes from two attribute stores on construction.
     """
 
-    line_span: Tuple[int, int] = field(
-        init=False, compare=False, repr=False, default=(-1, -1),
-    )
+    line_span = (-1, -1)
 
-    column_span: Tuple[int, int] = field(
-        init=False, compare=False, repr=False, default=(-1, -1),
-    )
+    column_span = (-1, -1)
 
     @property
     def line(self) -> int:
@@ -301,19 +302,37 @@ class Symbol(Amalgam):
 
     value: str
 
+    _cached_serial = -1
+    _cached_generation = -1
+    _cached_owner = cast("Dict[str, Amalgam]", {})
+
     def evaluate(self, environment: Environment) -> Amalgam:
         """
         Searches the provided `environment` fully with
         :attr:`Symbol.value`. Returns the :class:`.Amalgam` object
         bound to the :attr:`Symbol.value` in the environment. Returns
         a fatal :class:`.Notification` if a binding is not found.
+
+        The bindings owning :attr:`Symbol.value` are cached on the
+        node, and reused for as long as it is evaluated within the
+        same environment and no names were added or removed since.
         """
-        try:
-            with environment.search_at(depth=-1):
-                return environment[self.value]
-        except KeyError:
+        if (
+            self._cached_serial == environment.serial
+            and self._cached_generation == environment.generation
+        ):
+            return self._cached_owner[self.value]
+
+        owner = environment.resolve(self.value)
+        if owner is None:
             raise Failure(self, environment, "unbound symbol")
 
+        self._cached_serial = environment.serial
+        self._cached_generation = environment.generation
+        self._cached_owner = owner
+
+        return owner[self.value]
+
     def __repr__(self) -> str:  # pragma: no cover
         return self._make_repr(self.value)
 
@@ -393,6 +412,10 @@ class Function(Amalgam):
         Performs pre-processing depending on the values of
         :attr:`.Function.defer`, :attr:`.Function.contextual`, and
         :attr:`.Function.in_context`,
+
+        Deferred arguments are passed through as is, while calls with
+        one or two arguments to evaluate pass them positionally, sparing
+        the intermediate list.
         """
         if self.env is not None:
             environment = self.env
@@ -400,12 +423,22 @@ class Function(Amalgam):
         if self.contextual and not self.in_context:
             raise InvalidContextError(environment)
 
-        args = [
-            argument if self.defer else argument.evaluate(environment)
-            for argument in arguments
-        ]
-
-        return self.fn(environment, *args)
+        if self.defer:
+            return self.fn(environment, *arguments)
+
+        arity = len(arguments)
+        if arity == 1:
+            return self.fn(environment, arguments[0].evaluate(environment))
+        elif arity == 2:
+            x, y = arguments
+            return self.fn(
+                environment, x.evaluate(environment), y.evaluate(environment),
+            )
+
+        return self.fn(
+            environment,
+            *[argument.evaluate(environment) for argument in arguments],
+        )
 
     def with_name(self, name: str) -> Function:
         """
@@ -435,7 +468,23 @@ class SExpression(Amalgam):
     vals: Tuple[Amalgam, ...]
 
     def __init__(self, *vals: Amalgam) -> None:
+        self._adopt(vals)
+
+    @classmethod
+    def _from_vals(cls, vals: Tuple[Amalgam, ...]) -> SExpression:
+        """
+        Creates an :class:`SExpression` holding :data:`vals` as is,
+        sparing callers that already have a tuple from unpacking it.
+        """
+        s_expression = cls.__new__(cls)
+        s_expression._adopt(vals)
+        return s_expression
+
+    def _adopt(self, vals: Tuple[Amalgam, ...]) -> None:
+        """Initializes the :class:`SExpression` with :data:`vals`."""
         self.vals = vals
+        self._args = vals[1:]
+        self._arity = len(self._args)
 
     @property
     def func(self) -> Amalgam:
@@ -445,18 +494,32 @@ class SExpression(Amalgam):
     @property
     def args(self) -> Tuple[Amalgam, ...]:
         """The rest of the :attr:`SExpression.vals`."""
-        return self.vals[1:]
+        return self._args
 
     def evaluate(self, environment: Environment) -> Amalgam:
         """
         Evaluates :attr:`func` using `environment` before invoking
         the :meth:`call` method with `environment` and
         :attr:`SExpression.args`.
+
+        Calls with up to three arguments pass them positionally rather
+        than through argument unpacking.
         """
+
         head = self.func.evaluate(environment)
         if isinstance(head, Function):
+            arity = self._arity
+            args = self._args
             try:
-                return head.call(environment, *self.args)
+                if arity == 0:
+                    return head.call(environment)
+                elif arity == 1:
+                    return head.call(environment, args[0])
+                elif arity == 2:
+                    return head.call(environment, args[0], args[1])
+                elif arity == 3:
+                    return head.call(environment, args[0], args[1], args[2])
+                return head.call(environment, *args)
             except InvalidContextError as e:
                 # Instead of raising Failure with the Function instance,
                 # we try to reconstruct a sensible Failure using func,
@@ -498,44 +561,67 @@ class Vector(Amalgam, Generic[T]):
       mapping (:class:`Mapping[str, Amalgam]`): Mapping representing
         vectors with :class:`.Atom` s for odd indices and
         :class:`.Amalgam` s for even indices.
+
+    The position in :attr:`vals` of the value bound to each key of
+    :attr:`mapping` is kept alongside it, letting a single key be
+    updated without searching for it.
     """
 
     vals: Tuple[T, ...]
 
     def __init__(self, *vals: T) -> None:
+        self._adopt(vals)
+
+    @classmethod
+    def _from_vals(cls, vals: Tuple[T, ...]) -> Vector[T]:
+        """
+        Creates a :class:`Vector` holding :data:`vals` as is, sparing
+        callers that already have a tuple from unpacking it.
+        """
+        vector = cls.__new__(cls)
+        vector._adopt(vals)
+        return vector
+
+    def _adopt(self, vals: Tuple[T, ...]) -> None:
+        """Initializes the :class:`Vector` with :data:`vals`."""
         self.vals = vals
-        self.mapping = self._as_mapping()
+        self.mapping, self._indices = self._as_mapping()
 
     def evaluate(self, environment: Environment) -> Amalgam:
         """
         Creates a new :class:`.Vector` by evaluating every value in
         :attr:`Vector.vals`.
         """
-        return Vector(*(val.evaluate(environment) for val in self.vals))
+        return Vector._from_vals(
+            tuple([val.evaluate(environment) for val in self.vals]),
+        )
 
-    def _as_mapping(self) -> Mapping[str, Amalgam]:
+    def _as_mapping(self) -> Tuple[Mapping[str, Amalgam], Mapping[str, int]]:
         """
         Attemps to create a :class:`Mapping[str, Amalgam]` from
-        :attr:`Vector.vals`.
+        :attr:`Vector.vals`, along with the position of the value bound
+        to each key.
 
         Odd indices must be :class:`.Atom` s and even indices must be
-        :class:`.Amalgam` s. Returns an empty mapping if this form is
+        :class:`.Amalgam` s. Returns empty mappings if this form is
         not met.
         """
         if len(self.vals) % 2 != 0 or len(self.vals) == 0:
-            return {}
+            return {}, {}
 
         mapping = {}
+        indices = {}
 
         atoms = self.vals[::2]
         amalgams = self.vals[1::2]
 
-        for atom, amalgam in zip(atoms, amalgams):
+        for index, (atom, amalgam) in enumerate(zip(atoms, amalgams), 1):
             if not isinstance(atom, Atom):
-                return {}
+                return {}, {}
             mapping[atom.value] = amalgam
+            indices[atom.value] = 2 * index - 1
 
-        return mapping
+        return mapping, indices
 
     def __iter__(self) -> Iterator[T]:
         return iter(self.vals)
@@ -605,31 +691,45 @@ def create_fn(
 
     Non-variadic for first :data:`n` and last:data:`m` arguments
     (λ [x &rest y] -> [x &rest y]) 1 2 3 == [1 [2] 3]
+
+    Under an :class:`.engine.Engine`, each call is counted in its
+    :class:`.jit.HotSpots`, and :data:`fbody` is run through the
+    closure compiled for it once it is hot.
     """
 
+    cl_name = f"{fname}-closure"
+    variadic = "&rest" in fargs
+
+    if variadic:
+        l_count = fargs.index("&rest")
+        r_count = len(fargs) - l_count - 1
+        l_fargs = fargs[:l_count]
+        r_fargs = fargs[len(fargs) - r_count:]
+
     def closure_fn(environment: Environment, *arguments: Amalgam) -> Amalgam:
         """Callable responsible for evaluating `fbody`."""
 
-        try:
-            l_count = fargs.index("&rest")
-            r_count = len(fargs) - l_count - 1
-
-            l_names = zip(fargs[:l_count], arguments[:l_count])
+        if not variadic:
+            bindings = dict(zip(fargs, arguments))
 
-            if r_count == 0:
-                bindings = dict(l_names)
-                bindings["&rest"] = Vector(*arguments[l_count:])
-            else:
-                r_names = zip(fargs[-r_count:], arguments[-r_count:])
-                m_name = ("&rest", Vector(*arguments[l_count:-r_count]))
-                bindings = dict(chain(l_names, (m_name,), r_names))
+        elif r_count == 0:
+            bindings = dict(zip(l_fargs, arguments))
+            bindings["&rest"] = Vector._from_vals(arguments[l_count:])
 
-        except ValueError:
-            bindings = dict(zip(fargs, arguments))
+        else:
+            l_names = zip(l_fargs, arguments[:l_count])
+            r_names = zip(r_fargs, arguments[-r_count:])
+            m_name = ("&rest", Vector._from_vals(arguments[l_count:-r_count]))
+            bindings = dict(chain(l_names, (m_name,), r_names))
 
-        cl_env = environment.env_push(bindings, f"{fname}-closure")
+        cl_env = environment.env_push(bindings, cl_name, _owned=True)
 
-        result = fbody.evaluate(cl_env)
+        engine = cl_env.engine
+        compiled = engine.hot_spots.visit(fbody) if engine is not None else None
+        if compiled is not None:
+            result = compiled(cl_env)
+        else:
+            result = fbody.evaluate(cl_env)
         if isinstance(result, Function):
             return result.bind(cl_env)
         else:
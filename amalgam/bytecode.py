@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from typing import Any, List, Tuple, TYPE_CHECKING
+
+import amalgam.amalgams as am
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from amalgam.environment import Environment
+
+    Instruction = Tuple[int, Any, Tuple[am.Amalgam, ...]]
+    Code = List[Instruction]
+
+
+LOAD_CONST = 0
+LOAD_SYM = 1
+BUILD_VECTOR = 2
+JUMP_IF_DEFER = 3
+CALL = 4
+CALL_DEFER = 5
+JUMP = 6
+RET = 7
+
+
+class CompilationError(Exception):
+    """
+    Raised when an :class:`.amalgams.Amalgam` cannot be lowered into
+    bytecode.
+
+    Attributes:
+      amalgam (:class:`.amalgams.Amalgam`): The offending node.
+    """
+
+    def __init__(self, amalgam: am.Amalgam) -> None:
+        self.amalgam = amalgam
+
+
+def compile_to_bytecode(expr: am.Amalgam) -> Code:
+    """
+    Lowers a parsed :data:`expr` into a flat list of instructions.
+
+    Each instruction is an :data:`(op, arg, trail)` triple, where
+    :data:`trail` holds the node that emitted the instruction followed
+    by its enclosing nodes up to :data:`expr`, which is used to
+    rebuild :class:`.amalgams.FailureStack` s the same way nested
+    :meth:`.amalgams.Amalgam.evaluate` calls would.
+    """
+    code: Code = []
+    _compile(expr, code, ())
+    code.append((RET, None, (expr,)))
+    return code
+
+
+def _compile(
+    expr: am.Amalgam, code: Code, parents: Tuple[am.Amalgam, ...],
+) -> None:
+    """Recursively emits the instructions for :data:`expr`."""
+    trail = (expr, *parents)
+
+    if isinstance(expr, am.Symbol):
+        code.append((LOAD_SYM, expr.value, trail))
+
+    elif isinstance(expr, am.SExpression):
+        if not expr.vals:
+            raise CompilationError(expr)
+
+        _compile(expr.func, code, trail)
+
+        check = len(code)
+        code.append((JUMP_IF_DEFER, None, trail))
+
+        for arg in expr.args:
+            _compile(arg, code, trail)
+        code.append((CALL, len(expr.args), trail))
+
+        leave = len(code)
+        code.append((JUMP, None, trail))
+
+        code[check] = (JUMP_IF_DEFER, len(code), trail)
+        code.append((CALL_DEFER, expr, trail))
+
+        code[leave] = (JUMP, len(code), trail)
+
+    elif isinstance(expr, am.Vector):
+        for val in expr.vals:
+            _compile(val, code, trail)
+        code.append((BUILD_VECTOR, len(expr.vals), trail))
+
+    elif isinstance(expr, (am.Atom, am.Numeric, am.String, am.Quoted)):
+        code.append((LOAD_CONST, expr, trail))
+
+    else:
+        raise CompilationError(expr)
+
+
+def execute(code: Code, environment: Environment) -> am.Amalgam:
+    """
+    Runs compiled :data:`code` within an :data:`environment`.
+
+    Calls to functions that defer their arguments, are bound to an
+    environment, or are contextual are handed off to
+    :meth:`.amalgams.Function.call`, which evaluates the unevaluated
+    arguments as usual.
+    """
+    # Module globals and attributes used on every dispatch are rebound
+    # as locals, replacing dictionary lookups with fast local loads.
+    load_const, load_sym, build_vector = LOAD_CONST, LOAD_SYM, BUILD_VECTOR
+    jump_if_defer, call, call_defer, jump = JUMP_IF_DEFER, CALL, CALL_DEFER, JUMP
+    Function, Vector = am.Function, am.Vector
+    search_at = environment.search_at
+
+    stack: List[Any] = []
+    push = stack.append
+    pop = stack.pop
+    pc = 0
+
+    while True:
+        op, arg, trail = code[pc]
+        pc += 1
+
+        try:
+            if op == load_const:
+                push(arg)
+
+            elif op == load_sym:
+                try:
+                    with search_at(depth=-1):
+                        push(environment[arg])
+                except KeyError:
+                    raise am.Failure(trail[0], environment, "unbound symbol")
+
+            elif op == jump_if_defer:
+                head = stack[-1]
+                if not isinstance(head, Function):
+                    raise am.FailureStack(
+                        [am.Failure(head, environment, "not a callable")],
+                    )
+                if head.defer or head.contextual or head.env is not None:
+                    pc = arg
+
+            elif op == call:
+                start = len(stack) - arg
+                args = stack[start:]
+                del stack[start:]
+                head = pop()
+                push(head.fn(environment, *args))
+
+            elif op == jump:
+                pc = arg
+
+            elif op == build_vector:
+                start = len(stack) - arg
+                vals = stack[start:]
+                del stack[start:]
+                push(Vector._from_vals(tuple(vals)))
+
+            elif op == call_defer:
+                head = pop()
+                try:
+                    push(head.call(environment, *arg.args))
+                except am.InvalidContextError as e:
+                    raise am.FailureStack(
+                        [am.Failure(arg.func, e.environment, "invalid context")],
+                    )
+
+            else:
+                return pop()
+
+        except am.Failure as f:
+            _raise_inherited(am.FailureStack([f]), trail[1:], environment)
+
+        except am.FailureStack as s:
+            _raise_inherited(s, trail, environment)
+
+
+def _raise_inherited(
+    stack: am.FailureStack,
+    trail: Tuple[am.Amalgam, ...],
+    environment: Environment,
+) -> None:
+    """
+    Pushes an :data:`"inherited"` :class:`.amalgams.Failure` for every
+    node in :data:`trail` before raising :data:`stack`.
+    """
+    for amalgam in trail:
+        stack.push(am.Failure(amalgam, environment, "inherited"))
+    raise stack
@@ -1,14 +1,34 @@
+from collections import OrderedDict
+from functools import lru_cache
 import sys
-from typing import IO
-
-from prompt_toolkit import PromptSession
+from typing import IO, List
 
 import amalgam.amalgams as am
+import amalgam.bytecode as bc
 import amalgam.environment as ev
+import amalgam.jit as jit
 import amalgam.primordials as pd
 import amalgam.parser as pr
 
 
+CODE_CACHE_SIZE = 4096
+"""
+The number of compiled inputs kept in :attr:`Engine.code_cache`
+before the least recently used one is discarded.
+"""
+
+
+PARSE_CACHE_SIZE = 4096
+"""
+The number of parsed inputs memoized by each :class:`Engine`.
+
+Parsed expressions are reused for repeated inputs, but never across
+engines: evaluation records lookup caches on the nodes, such as the
+bindings owning a :class:`.amalgams.Symbol`, which must not outlive
+or leak into another :class:`Engine`.
+"""
+
+
 class Engine:
     """
     Class that serves as the frontend for parsing and running programs.
@@ -20,17 +40,34 @@ class Engine:
         :class:`.engine.Engine` instance wrapped within a
         :class:`.amalgams.Internal`, accessible through the
         `~engine~` key.
+
+      code_cache (:class:`OrderedDict[str, .bytecode.Code]`): Compiled
+        bytecode keyed by the text it was compiled from, holding at
+        most :data:`CODE_CACHE_SIZE` entries.
+
+      hot_spots (:class:`.jit.HotSpots`): Evaluation counts and
+        compiled closures of the S-Expressions run by this instance.
     """
 
     def __init__(self) -> None:
         self.environment = ev.Environment(
-            bindings={**pd.FUNCTIONS}, name="global", engine=self,
+            bindings=pd.FUNCTIONS.copy(), name="global", engine=self, _owned=True,
         )
+        self.code_cache: "OrderedDict[str, bc.Code]" = OrderedDict()
+        self.hot_spots = jit.HotSpots()
+        self._cached_parse = lru_cache(maxsize=PARSE_CACHE_SIZE)(pr.parse)
 
     def repl(self, *, prompt: str = "> ", prompt_cont: str = "| ") -> None:
         """
         Runs a REPL session that supports multi-line input.
 
+        Continued lines are scanned with :func:`.parser.scan_openings`,
+        deferring parsing until the buffered input can be complete.
+
+        :mod:`prompt_toolkit` is only imported here, sparing
+        non-interactive uses of the :class:`Engine` from its import
+        time.
+
         Parameters:
           prompt (:class:`str`): The style of the prompt on
             regular lines.
@@ -38,8 +75,11 @@ class Engine:
           prompt_cont (:class:`str`): The style of the prompt on
             continued lines.
         """
+        from prompt_toolkit import PromptSession
+
         cont = False
-        buffer = []
+        buffer: List[str] = []
+        depth, in_string = 0, False
         session:  PromptSession = PromptSession()
 
         while True:
@@ -50,29 +90,34 @@ class Engine:
             except EOFError:
                 pd._exit(self.environment)
 
+            depth, in_string = pr.scan_openings(line, depth, in_string)
+
+            if depth > 0 or in_string:
+                cont = True
+                continue
+
+            depth, in_string = 0, False
             lines = "\n".join(buffer)
 
             try:
-                expr = pr.parse(lines)
+                expr = self._cached_parse(lines, "<stdin>")
                 result = expr.evaluate(self.environment)
 
             except pr.MissingClosing:
                 cont = True
+                continue
 
             except am.FailureStack as s:
                 print(s.make_report(lines, "<stdin>"), file=sys.stderr)
-                buffer.clear()
-                cont = False
 
             except Exception as e:
-                buffer.clear()
-                cont = False
                 print(f"{e.__class__.__qualname__}: {e}")
 
             else:
                 print(result)
-                buffer.clear()
-                cont = False
+
+            buffer.clear()
+            cont = False
 
     def _interpret(self, text: str, source: str = "<unknown>") -> am.Amalgam:
         """
@@ -80,8 +125,28 @@ class Engine:
 
         Internal-facing method intended for use within
         :mod:`amalgam.primordials`.
+
+        Runs the :mod:`amalgam.bytecode` compiled from :data:`text`,
+        falling back to evaluating the parsed expression directly when
+        it cannot be compiled. Compiled bytecode is reused through
+        :attr:`code_cache`, which drops the least recently run text
+        once it grows past :data:`CODE_CACHE_SIZE`.
         """
-        return pr.parse(text, source).evaluate(self.environment)
+        code = self.code_cache.get(text)
+
+        if code is None:
+            expr = self._cached_parse(text, source)
+            try:
+                code = bc.compile_to_bytecode(expr)
+            except bc.CompilationError:
+                return expr.evaluate(self.environment)
+            self.code_cache[text] = code
+            if len(self.code_cache) > CODE_CACHE_SIZE:
+                self.code_cache.popitem(last=False)
+        else:
+            self.code_cache.move_to_end(text)
+
+        return bc.execute(code, self.environment)
 
     def interpret(
         self, text: str, source: str = "<unknown>", file: IO = sys.stdout
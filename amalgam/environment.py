@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
+from itertools import count
 from typing import (
-    cast,
     Dict,
     Iterable,
+    List,
     Mapping,
     Optional,
+    Set,
     TYPE_CHECKING,
 )
 
@@ -18,6 +19,11 @@ if TYPE_CHECKING:  # pragma: no cover
     Bindings = Mapping[str, Amalgam]
 
 
+_MISSING = object()
+
+_serials = count()
+
+
 class TopLevelPop(Exception):
     """Raised at :meth:`Environment.env_pop`."""
 
@@ -51,21 +57,66 @@ class Environment:
       engine (:class:`Engine`): A reference to the engine managing the
         :class:`.parser.Parser` instance and the global
         :class:`.Environment` instance.
+
+      serial (:class:`int`): A number unique to each
+        :class:`Environment` instance, never reused unlike :func:`id`.
+
+      generation (:class:`int`): A class-wide counter incremented
+        whenever a name is removed from any :class:`Environment`, or
+        added where it may shadow an existing binding.
+
+    Unbounded lookups memoize the :attr:`bindings` that own each name,
+    turning repeated searches through deep chains into a single hash
+    probe. These caches are invalidated whenever a name is removed
+    from any :class:`Environment` through the mapping interface, or
+    added where a memoized lookup could have seen it, which is why
+    :attr:`bindings` should not be mutated directly.
     """
 
+    __slots__ = (
+        "bindings",
+        "parent",
+        "level",
+        "search_depth",
+        "_effective_depth",
+        "_pending_depth",
+        "_saved_depths",
+        "name",
+        "engine",
+        "serial",
+        "_resolved",
+        "_resolved_at",
+    )
+
+    generation: int = 0
+
+    _unresolved: Set[str] = set()
+
     def __init__(
         self,
         bindings: Bindings = None,
         parent: Environment = None,
         name: str = "unknown",
         engine: Engine = None,
+        *,
+        _owned: bool = False,
     ) -> None:
-        self.bindings: Dict[str, Amalgam] = {**bindings} if bindings else {}
+        self.bindings: Dict[str, Amalgam]
+        if _owned and bindings is not None:
+            self.bindings = bindings  # type: ignore
+        else:
+            self.bindings = {**bindings} if bindings else {}
         self.parent: Optional[Environment] = parent
         self.level: int = parent.level + 1 if parent else 0
         self.search_depth: int = 0
+        self._effective_depth: int = 0
+        self._pending_depth: int = 0
+        self._saved_depths: List[int] = []
         self.name = name
-        self.engine = cast("Engine", engine)
+        self.engine: Engine = engine  # type: ignore
+        self.serial = next(_serials)
+        self._resolved: Dict[str, Optional[Dict[str, Amalgam]]]
+        self._resolved_at: int = -1
 
     @property
     def search_chain(self) -> Iterable[Dict[str, Amalgam]]:
@@ -73,20 +124,80 @@ class Environment:
         Yields :attr:`bindings` of nested :class:`Environment`
         instances.
         """
-        yield self.bindings
+        _self = self
+        yield _self.bindings
 
-        if self.parent is None:
-            return
+        for _ in range(self._effective_depth):
+            _self = _self.parent  # type: ignore
+            yield _self.bindings
 
-        if self.search_depth >= 0:
-            depth = self.search_depth
-        else:
-            depth = self.level
+    def resolve(self, item: str) -> Optional[Dict[str, Amalgam]]:
+        """
+        Finds the :attr:`bindings` owning `item` across the entire
+        linked list, or :obj:`None` if it is unbound.
 
-        _self = self.parent
-        for _ in range(depth):
-            yield _self.bindings
-            _self = _self.parent
+        Results are memoized on every :class:`Environment` visited
+        while searching, so that child environments can reuse the
+        resolutions made by their parents.
+        """
+        generation = Environment.generation
+        pending = []
+        owner: Optional[Dict[str, Amalgam]] = None
+
+        env: Optional[Environment] = self
+        while env is not None:
+            if env._resolved_at != generation:
+                env._resolved = {}
+                env._resolved_at = generation
+            else:
+                resolved = env._resolved.get(item, _MISSING)
+                if resolved is not _MISSING:
+                    owner = resolved  # type: ignore
+                    break
+
+            pending.append(env)
+
+            if item in env.bindings:
+                owner = env.bindings
+                break
+
+            env = env.parent
+
+        for env in pending:
+            env._resolved[item] = owner
+
+        if owner is None:
+            Environment._unresolved.add(item)
+
+        return owner
+
+    @staticmethod
+    def _invalidate() -> None:
+        """Discards the memoized resolutions of every environment."""
+        Environment.generation += 1
+        Environment._unresolved.clear()
+
+    def _introduce(self, item: str, value: Amalgam) -> None:
+        """
+        Binds a new `item` to :attr:`bindings`.
+
+        Memoized resolutions are only invalidated if `item` shadows a
+        binding in a parent environment or was previously found to be
+        unbound, as no other lookup could have been affected.
+        """
+        shadows = item in Environment._unresolved
+
+        env = self.parent
+        while env is not None and not shadows:
+            shadows = item in env.bindings
+            env = env.parent
+
+        if shadows:
+            Environment._invalidate()
+        elif self._resolved_at == Environment.generation:
+            self._resolved[item] = self.bindings
+
+        self.bindings[item] = value
 
     def __getitem__(self, item: str) -> Amalgam:
         """
@@ -95,11 +206,18 @@ class Environment:
         Searches with respect to the current :attr:`search_depth` of the
         calling :class:`Environment` instance. If an existing `item`
         is encountered at a certain depth less than the target depth,
-        returns that `item`, otherwise, raises :class:`SymbolNotFound`.
+        returns that `item`, otherwise, raises :class:`KeyError`.
         """
+        if self.search_depth < 0:
+            owner = self.resolve(item)
+            if owner is None:
+                raise KeyError(item)
+            return owner[item]
+
         for bindings in self.search_chain:
-            if item in bindings:
-                return bindings[item]
+            value = bindings.get(item, _MISSING)
+            if value is not _MISSING:
+                return value  # type: ignore
         raise KeyError(item)
 
     def __setitem__(self, item: str, value: Amalgam) -> None:
@@ -111,13 +229,29 @@ class Environment:
         encountered at a certain depth less than the target depth,
         overrides that `item` instead.
         """
-        _search_chain = list(self.search_chain)
-        for bindings in _search_chain:
-            if item in bindings:
-                bindings[item] = value
+        if self.search_depth == 0:
+            if item in self.bindings:
+                self.bindings[item] = value
+            else:
+                self._introduce(item, value)
+            return
+
+        if self.search_depth < 0:
+            owner = self.resolve(item)
+            if owner is not None:
+                owner[item] = value
+                return
+
+        env = self
+        for _ in range(self._effective_depth):
+            if item in env.bindings or env.parent is None:
                 break
+            env = env.parent
+
+        if item in env.bindings:
+            env.bindings[item] = value
         else:
-            _search_chain[-1][item] = value
+            env._introduce(item, value)
 
     def __delitem__(self, item: str) -> None:
         """
@@ -129,11 +263,10 @@ class Environment:
         deletes that `item` instead.
         """
         for bindings in self.search_chain:
-            if item in bindings:
-                del bindings[item]
-                break
-        else:
-            raise KeyError(item)
+            if bindings.pop(item, _MISSING) is not _MISSING:
+                Environment._invalidate()
+                return
+        raise KeyError(item)
 
     def __contains__(self, item: str) -> bool:
         """
@@ -144,13 +277,15 @@ class Environment:
         encountered at a certain depth less than the target depth,
         immediately returns `True`, otherwise, returns `False`.
         """
+        if self.search_depth < 0:
+            return self.resolve(item) is not None
+
         for bindings in self.search_chain:
             if item in bindings:
                 return True
         return False
 
-    @contextmanager
-    def search_at(self, *, depth=0):
+    def search_at(self, *, depth: int = 0) -> Environment:
         """
         Context manager for temporarily setting the lookup depth.
 
@@ -171,6 +306,11 @@ class Environment:
         >>>
         >>> with cl_env.search_at(depth=-1):
         ...    cl_env["+"]  # Searches `env`
+
+        The calling :class:`Environment` instance serves as the context
+        manager itself, avoiding an allocation on every call. The
+        `depth` only takes effect once the ``with`` block is entered,
+        and nested uses restore the enclosing depth on exit.
         """
         if depth > self.level:
             exc = ValueError(
@@ -178,23 +318,34 @@ class Environment:
             )
             raise exc
 
+        self._pending_depth = depth
+
+        return self
+
+    def __enter__(self) -> Environment:
+        depth = self._pending_depth
+        self._saved_depths.append(self.search_depth)
         self.search_depth = depth
+        self._effective_depth = depth if depth >= 0 else self.level
+        return self
 
-        try:
-            yield self
-        finally:
-            self.search_depth = 0
+    def __exit__(self, *exc_info: object) -> None:
+        depth = self.search_depth = self._saved_depths.pop()
+        self._effective_depth = depth if depth >= 0 else self.level
 
-    def env_push(self, bindings: Bindings = None, name: str = None) -> Environment:
+    def env_push(
+        self, bindings: Bindings = None, name: str = None, *, _owned: bool = False,
+    ) -> Environment:
         """
         Creates a new :class:`Environment` and binds the calling
         instance as its parent environment.
+
+        Passing :data:`_owned` adopts :data:`bindings` as is instead of
+        copying it, for callers that hand over a freshly built dict.
         """
         if name is None:
             name = f"{self.name}-child"
-        return Environment(
-            bindings=bindings, parent=self, name=name, engine=self.engine,
-        )
+        return Environment(bindings, self, name, self.engine, _owned=_owned)
 
     def env_pop(self) -> Environment:
         """
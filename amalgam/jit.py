@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional, Tuple, TYPE_CHECKING
+
+import amalgam.amalgams as am
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from amalgam.environment import Environment
+
+    Compiled = Callable[[Environment], am.Amalgam]
+
+
+HOT_THRESHOLD = 50
+"""
+The number of times a function body is evaluated before it gets
+compiled with :func:`compile_closure`.
+"""
+
+
+HOT_SPOTS_SIZE = 4096
+"""
+The number of nodes a :class:`HotSpots` table tracks before it starts
+over.
+"""
+
+
+class HotSpots:
+    """
+    Side table counting how often each function body is evaluated,
+    owned by an :class:`.engine.Engine`.
+
+    Only the bodies of functions made by :func:`.amalgams.create_fn`
+    are visited, once per call, so other nodes pay nothing for it.
+    Nodes are keyed by :func:`id` and never modified, letting parse
+    trees be shared freely. Every entry holds on to its node, so an
+    :func:`id` cannot be reused by another node while its entry lives.
+    Both tables start over once they reach :data:`HOT_SPOTS_SIZE`,
+    releasing the nodes they held.
+
+    Attributes:
+      hits (:class:`Dict[int, Tuple[Amalgam, int]]`): Nodes that are
+        not hot yet, along with their evaluation counts.
+
+      compiled (:class:`Dict[int, Tuple[Amalgam, Compiled]]`): Hot
+        nodes, along with the closures compiled for them.
+    """
+
+    def __init__(self) -> None:
+        self.hits: Dict[int, Tuple[am.Amalgam, int]] = {}
+        self.compiled: Dict[int, Tuple[am.Amalgam, Compiled]] = {}
+
+    def visit(self, expr: am.Amalgam) -> Optional[Compiled]:
+        """
+        Counts an evaluation of :data:`expr`, returning the closure
+        compiled with :func:`compile_closure` once it is hot.
+        """
+        key = id(expr)
+        entry = self.compiled.get(key)
+        if entry is not None:
+            return entry[1]
+
+        _, hits = self.hits.get(key, (expr, 0))
+        hits += 1
+        if hits < HOT_THRESHOLD:
+            if len(self.hits) >= HOT_SPOTS_SIZE:
+                self.hits.clear()
+            self.hits[key] = (expr, hits)
+            return None
+
+        self.hits.pop(key, None)
+        if len(self.compiled) >= HOT_SPOTS_SIZE:
+            self.compiled.clear()
+        compiled = compile_closure(expr)
+        self.compiled[key] = (expr, compiled)
+        return compiled
+
+
+def compile_closure(expr: am.Amalgam) -> Compiled:
+    """
+    Compiles :data:`expr` into a tree of specialized Python closures.
+
+    The resulting callable takes an :class:`.environment.Environment`
+    and behaves exactly like :meth:`.amalgams.Amalgam.evaluate`,
+    including how :class:`.amalgams.FailureStack` s are built, while
+    skipping the per-node dispatch done by
+    :class:`.amalgams.AmalgamMeta` and :meth:`.amalgams.Function.call`.
+
+    Symbols are left to :meth:`.amalgams.Symbol.evaluate`, which
+    already resolves them through its inline cache.
+    """
+    if isinstance(expr, am.SExpression) and expr.vals:
+        return _compile_s_expression(expr)
+
+    elif isinstance(expr, am.Vector):
+        return _compile_vector(expr)
+
+    return expr.evaluate
+
+
+def _compile_s_expression(expr: am.SExpression) -> Compiled:
+    """
+    Compiles a call, evaluating arguments inline unless the callee
+    defers them, is contextual, or is bound to an environment.
+    """
+    func = expr.func
+    args = expr.args
+    head_c = compile_closure(func)
+    args_c: Tuple[Compiled, ...] = tuple(map(compile_closure, args))
+
+    def s_expression(environment: Environment) -> am.Amalgam:
+        try:
+            head = head_c(environment)
+            if not isinstance(head, am.Function):
+                raise am.FailureStack(
+                    [am.Failure(head, environment, "not a callable")],
+                )
+            if head.defer or head.contextual or head.env is not None:
+                try:
+                    return head.call(environment, *args)
+                except am.InvalidContextError as e:
+                    raise am.FailureStack(
+                        [am.Failure(func, e.environment, "invalid context")],
+                    )
+            return head.fn(environment, *[arg_c(environment) for arg_c in args_c])
+        except am.Failure as f:
+            raise am.FailureStack([f])
+        except am.FailureStack as s:
+            s.push(am.Failure(expr, environment, "inherited"))
+            raise
+
+    return s_expression
+
+
+def _compile_vector(expr: am.Vector) -> Compiled:
+    """Compiles the construction of a :class:`.amalgams.Vector`."""
+    vals_c: Tuple[Compiled, ...] = tuple(map(compile_closure, expr.vals))
+    Vector = am.Vector
+
+    def vector(environment: Environment) -> am.Amalgam:
+        try:
+            return Vector._from_vals(
+                tuple([val_c(environment) for val_c in vals_c]),
+            )
+        except am.Failure as f:
+            raise am.FailureStack([f])
+        except am.FailureStack as s:
+            s.push(am.Failure(expr, environment, "inherited"))
+            raise
+
+    return vector
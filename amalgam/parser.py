@@ -1,9 +1,13 @@
 from fractions import Fraction
+from functools import lru_cache
+from hashlib import blake2b
 import importlib.resources as resources
-import re
-from typing import cast
+import os
+from pathlib import Path
+import sys
+from typing import cast, Any, Dict, Optional, Tuple, Type
 
-from lark import v_args, Lark, Transformer, UnexpectedInput
+from lark import __version__ as lark_version, Lark, Transformer, UnexpectedInput
 
 import amalgam.amalgams as am
 
@@ -11,75 +15,146 @@ import amalgam.amalgams as am
 GRAMMAR = resources.read_text(__package__, "grammar.lark")
 
 
-@v_args(inline=True)
+def default_cache_dir() -> Path:
+    """
+    Returns the directory used for caching the parser tables on disk,
+    respecting :data:`XDG_CACHE_HOME` if set.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "amalgam"
+
+
+@lru_cache(maxsize=4096)
+def _to_fraction(number: str) -> Fraction:
+    """
+    Memoized :class:`Fraction` construction. Fractions are immutable,
+    making them safe to share between nodes.
+
+    The grammar already guarantees a numerator and a denominator, so
+    both are converted with :class:`int` instead of having
+    :class:`Fraction` parse the text with a regular expression.
+    """
+    numerator, _, denominator = number.partition("/")
+    return Fraction(int(numerator), int(denominator))
+
+
+def _unescape(text: str) -> str:
+    """
+    Drops each backslash that is neither preceded by a backslash nor
+    followed by a backslash or a double quote, keeping the character
+    that follows it.
+
+    Works on the pieces between backslashes rather than through a
+    regular expression, as strings rarely contain more than a few.
+    """
+    if "\\" not in text:
+        return text
+
+    pieces = text.split("\\")
+    result = [pieces[0]]
+
+    for index in range(1, len(pieces)):
+        before, after = pieces[index - 1], pieces[index]
+        if (before or index == 1) and after and after[0] != "\"":
+            result.append(after)
+        else:
+            result.append("\\")
+            result.append(after)
+
+    return "".join(result)
+
+
 class Expression(Transformer):
     """
     Transforms expressions in text into their respective
     :class:`.amalgams.Amalgam` representations.
+
+    Identifiers of symbols and atoms are interned, allowing binding
+    lookups to compare names by identity.
+
+    Each method takes the list of matched children as is, skipping the
+    extra call made by :func:`lark.v_args` for every node, and stores
+    the spans of the node directly rather than through
+    :meth:`.amalgams.Located.located_on`. Constructors are bound as
+    default arguments, turning their per-node global and attribute
+    lookups into local ones.
     """
 
-    def symbol(self, identifier):
-        return am.Symbol(str(identifier)).located_on(
-            lines=(identifier.line, identifier.end_line),
-            columns=(identifier.column, identifier.end_column),
-        )
+    def symbol(self, children, _Symbol=am.Symbol, _intern=sys.intern):
+        identifier, = children
 
-    def atom(self, colon, identifier):
-        return am.Atom(str(identifier)).located_on(
-            lines=(colon.line, identifier.end_line),
-            columns=(colon.column, identifier.end_column),
-        )
+        symbol = _Symbol(_intern(str(identifier)))
+        symbol.line_span = (identifier.line, identifier.end_line)
+        symbol.column_span = (identifier.column, identifier.end_column)
+        return symbol
 
-    def integral(self, number):
-        return am.Numeric(int(number)).located_on(
-            lines=(number.line, number.end_line),
-            columns=(number.column, number.end_column),
-        )
+    def atom(self, children, _Atom=am.Atom, _intern=sys.intern):
+        colon, identifier = children
 
-    def floating(self, number):
-        return am.Numeric(float(number)).located_on(
-            lines=(number.line, number.end_line),
-            columns=(number.column, number.end_column),
-        )
+        atom = _Atom(_intern(str(identifier)))
+        atom.line_span = (colon.line, identifier.end_line)
+        atom.column_span = (colon.column, identifier.end_column)
+        return atom
 
-    def fraction(self, number):
-        return am.Numeric(Fraction(number)).located_on(
-            lines=(number.line, number.end_line),
-            columns=(number.column, number.end_column),
-        )
+    def integral(self, children, _Numeric=am.Numeric):
+        number, = children
 
-    def string(self, *values):
-        l_quote, text, r_quote = values
+        numeric = _Numeric(int(number))
+        numeric.line_span = (number.line, number.end_line)
+        numeric.column_span = (number.column, number.end_column)
+        return numeric
 
-        value = "".join(values)
-        value = re.sub(r"(?<!\\)\\([^\"\\])", r"\g<1>", value)
+    def floating(self, children, _Numeric=am.Numeric):
+        number, = children
 
-        return am.String(value.strip("\"")).located_on(
-            lines=(l_quote.line, r_quote.line),
-            columns=(l_quote.column, r_quote.column),
-        )
+        numeric = _Numeric(float(number))
+        numeric.line_span = (number.line, number.end_line)
+        numeric.column_span = (number.column, number.end_column)
+        return numeric
 
-    def s_expression(self, *values):
-        l_paren, *expressions, r_paren = values
+    def fraction(
+        self, children, _Numeric=am.Numeric, _to_fraction=_to_fraction,
+    ):
+        number, = children
 
-        return am.SExpression(*expressions).located_on(
-            lines=(l_paren.line, r_paren.end_line),
-            columns=(l_paren.column, r_paren.end_column),
-        )
+        numeric = _Numeric(_to_fraction(str(number)))
+        numeric.line_span = (number.line, number.end_line)
+        numeric.column_span = (number.column, number.end_column)
+        return numeric
 
-    def vector(self, *values):
-        l_bracket, *expressions, r_bracket = values
+    def string(self, children, _String=am.String, _unescape=_unescape):
+        l_quote, r_quote = children[0], children[-1]
 
-        return am.Vector(*expressions).located_on(
-            lines=(l_bracket.line, r_bracket.end_line),
-            columns=(l_bracket.column, r_bracket.end_column),
-        )
+        value = _unescape(str(children[1])) if len(children) == 3 else ""
 
-    def quoted(self, quote, expression):
-        return am.Quoted(expression).located_on(
-            lines=(quote.line, expression.end_line),
-            columns=(quote.column, expression.end_column),
-        )
+        string = _String(value)
+        string.line_span = (l_quote.line, r_quote.line)
+        string.column_span = (l_quote.column, r_quote.column)
+        return string
+
+    def s_expression(self, children, _SExpression=am.SExpression):
+        l_paren, r_paren = children[0], children[-1]
+
+        s_expression = _SExpression._from_vals(tuple(children[1:-1]))
+        s_expression.line_span = (l_paren.line, r_paren.end_line)
+        s_expression.column_span = (l_paren.column, r_paren.end_column)
+        return s_expression
+
+    def vector(self, children, _Vector=am.Vector):
+        l_bracket, r_bracket = children[0], children[-1]
+
+        vector = _Vector._from_vals(tuple(children[1:-1]))
+        vector.line_span = (l_bracket.line, r_bracket.end_line)
+        vector.column_span = (l_bracket.column, r_bracket.end_column)
+        return vector
+
+    def quoted(self, children, _Quoted=am.Quoted):
+        quote, expression = children
+
+        quoted = _Quoted(expression)
+        quoted.line_span = (quote.line, expression.end_line)
+        quoted.column_span = (quote.column, expression.end_column)
+        return quoted
 
 
 class ParsingError(Exception):
@@ -119,7 +194,10 @@ class MissingOpening(ParsingError):
     """Raised on missing opening parentheses or brackets."""
 
 
-ERROR_EXAMPLES = {
+ErrorClass = Type[ParsingError]
+
+
+ERROR_EXAMPLES: Dict[ErrorClass, Tuple[str, ...]] = {
     ExpectedEOF: ("foo bar",),
     ExpectedExpression: ("",),
     MissingClosing: (
@@ -131,17 +209,148 @@ ERROR_EXAMPLES = {
 }
 
 
-EXPR_PARSER = Lark(GRAMMAR, parser="lalr", transformer=Expression())
+def _make_parser() -> Lark:
+    """
+    Creates the LALR parser for :data:`GRAMMAR`.
+
+    The parser tables are cached in :func:`default_cache_dir` under a
+    name derived from the grammar, the :mod:`lark` version, and the
+    running interpreter, sparing later runs from compiling the grammar
+    again. New caches are written to a temporary file first so that
+    concurrent runs never load a partial one. Falls back to building
+    the tables in memory if the cache cannot be used.
+    """
+    key = blake2b(
+        f"{sys.implementation.cache_tag}\0{lark_version}\0{GRAMMAR}".encode(),
+        digest_size=16,
+    )
+    path = default_cache_dir() / f"grammar-{key.hexdigest()}.lark"
+    temp = path.with_suffix(f".{os.getpid()}.tmp")
+
+    try:
+        if path.exists():
+            return Lark(
+                GRAMMAR, parser="lalr", transformer=Expression(), cache=str(path),
+            )
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        parser = Lark(
+            GRAMMAR, parser="lalr", transformer=Expression(), cache=str(temp),
+        )
+        os.replace(temp, path)
+        return parser
+
+    except Exception:
+        for stale in (path, temp):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+    return Lark(GRAMMAR, parser="lalr", transformer=Expression())
+
+
+_EXPR_PARSER: Optional[Lark] = None
+
+
+def _get_parser() -> Lark:
+    """
+    Returns the parser created by :func:`_make_parser`, deferring its
+    creation until something is parsed.
+    """
+    global _EXPR_PARSER
+    if _EXPR_PARSER is None:
+        _EXPR_PARSER = _make_parser()
+    return _EXPR_PARSER
+
+
+def __getattr__(name: str) -> Any:
+    """Provides :data:`EXPR_PARSER` through :func:`_get_parser`."""
+    if name == "EXPR_PARSER":
+        return _get_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+ErrorTable = Dict[Any, Tuple[Dict[Tuple[str, str], ErrorClass], ErrorClass]]
+
+_ERROR_TABLE: Optional[ErrorTable] = None
+
+
+def _get_error_table() -> ErrorTable:
+    """
+    Returns a table of the errors in :data:`ERROR_EXAMPLES`, parsing
+    each example only once.
+
+    Maps each parser state reached by an example to the error types of
+    the examples that failed on a given token there, along with the
+    error type of the first example to fail in that state, mirroring
+    how :meth:`lark.UnexpectedInput.match_examples` prefers matches.
+    """
+    global _ERROR_TABLE
+
+    if _ERROR_TABLE is None:
+        _ERROR_TABLE = {}
+        for exc_cls, examples in ERROR_EXAMPLES.items():
+            for example in examples:
+                try:
+                    _get_parser().parse(example)
+                except UnexpectedInput as u:
+                    tokens, _ = _ERROR_TABLE.setdefault(u.state, ({}, exc_cls))
+                    token = getattr(u, "token", None)
+                    if token is not None:
+                        tokens.setdefault((token.type, str(token)), exc_cls)
+
+    return _ERROR_TABLE
+
+
+def _classify_error(u: UnexpectedInput) -> Optional[ErrorClass]:
+    """Finds the :class:`ParsingError` that best describes `u`."""
+    entry = _get_error_table().get(u.state)
+    if entry is None:
+        return None
+
+    tokens, exc_cls = entry
+    token = getattr(u, "token", None)
+    if token is not None:
+        return tokens.get((token.type, str(token)), exc_cls)
+    return exc_cls
 
 
 def parse(text: str, source: str = "<unknown>") -> am.Amalgam:
     """Facilitates regular parsing that can fail."""
     try:
-        return cast(am.Amalgam, EXPR_PARSER.parse(text))
+        return cast(am.Amalgam, _get_parser().parse(text))
     except UnexpectedInput as u:
-        exc_cls = u.match_examples(
-            EXPR_PARSER.parse, ERROR_EXAMPLES.items(),
-        )
+        exc_cls = _classify_error(u)
         if exc_cls is None:
             raise
         raise exc_cls(u.line, u.column, text, source) from None
+
+
+def scan_openings(
+    line: str, depth: int = 0, in_string: bool = False,
+) -> Tuple[int, bool]:
+    """
+    Tracks unclosed parentheses, brackets, and strings across lines.
+
+    Continues from the :data:`depth` and :data:`in_string` state
+    returned for the previous line, so that only :data:`line` has to
+    be scanned. Input is incomplete while the returned depth is
+    positive or a string is left open.
+    """
+    escaped = False
+    for char in line:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == "\"":
+                in_string = False
+        elif char == "\"":
+            in_string = True
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+    return depth, in_string
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from fractions import Fraction
-from typing import Union, TYPE_CHECKING
+from functools import reduce
+from operator import attrgetter, mul
+from typing import TYPE_CHECKING
 
 import amalgam.amalgams as am
 from amalgam.primordials.utils import make_function
@@ -15,10 +16,21 @@ if TYPE_CHECKING:  # pragma: no cover
 ARITHMETIC: Store = {}
 
 
+_value = attrgetter("value")
+
+
 @make_function(ARITHMETIC, "+")
 def _add(env: Environment, *nums: am.Numeric) -> am.Numeric:
-    """Returns the sum of :data:`nums`."""
-    return am.Numeric(sum(num.value for num in nums))
+    """
+    Returns the sum of :data:`nums`.
+
+    Like the other arithmetic functions, takes a shortcut for two
+    operands, the arity of most calls.
+    """
+    if len(nums) == 2:
+        x, y = nums
+        return am.Numeric(x.value + y.value)
+    return am.Numeric(sum(map(_value, nums)))
 
 
 @make_function(ARITHMETIC, "-")
@@ -26,20 +38,20 @@ def _sub(env: Environment, *nums: am.Numeric) -> am.Numeric:
     """
     Subtracts :data:`nums[0]` and the summation of :data:`nums[1:]`.
     """
-    x, *ns = (num.value for num in nums)
-    y: Union[float, Fraction] = 0
-    for n in ns:
-        y += n
-    return am.Numeric(x - y)
+    if len(nums) == 2:
+        x, y = nums
+        return am.Numeric(x.value - y.value)
+    x, *ns = map(_value, nums)
+    return am.Numeric(x - sum(ns))
 
 
 @make_function(ARITHMETIC, "*")
 def _mul(env: Environment, *nums: am.Numeric) -> am.Numeric:
     """Returns the product of :data:`nums`."""
-    prod: Union[float, Fraction] = 1
-    for num in nums:
-        prod *= num.value
-    return am.Numeric(prod)
+    if len(nums) == 2:
+        x, y = nums
+        return am.Numeric(x.value * y.value)
+    return am.Numeric(reduce(mul, map(_value, nums), 1))
 
 
 @make_function(ARITHMETIC, "/")
@@ -47,8 +59,8 @@ def _div(env: Environment, *nums: am.Numeric) -> am.Numeric:
     """
     Divides :data:`nums[0]` and the product of :data:`nums[1:]`
     """
-    x, *ns = (num.value for num in nums)
-    y: Union[float, Fraction] = 1
-    for n in ns:
-        y *= n
-    return am.Numeric(x / y)
+    if len(nums) == 2:
+        x, y = nums
+        return am.Numeric(x.value / y.value)
+    x, *ns = map(_value, nums)
+    return am.Numeric(x / reduce(mul, ns, 1))
@@ -1,66 +1,84 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Callable, TYPE_CHECKING
 
 import amalgam.amalgams as am
-from amalgam.primordials.utils import make_function
+from amalgam.primordials.utils import make_function, FALSE, TRUE
 
 
 if TYPE_CHECKING:  # pragma: no cover
     from amalgam.environment import Environment
     from amalgam.primordials.utils import Store
 
+    Truthiness = Callable[[am.Amalgam], bool]
+
 
 BOOLEAN: Store = {}
 
 
+_FALSY_ATOMS = frozenset(("FALSE", "NIL"))
+
+
+def _is_true(expr: am.Amalgam) -> bool:
+    """
+    Checks for the truthiness of an :data:`expr` as a :class:`bool`.
+
+    Empty strings and vectors, zero, :data:`:FALSE`, and :data:`:NIL`
+    are falsy. The exact type of :data:`expr` is dispatched on once,
+    atoms first as most conditions evaluate to one.
+    """
+    cls = type(expr)
+    if cls is am.Atom:
+        return expr.value not in _FALSY_ATOMS  # type: ignore
+    elif cls is am.Numeric:
+        return expr.value != 0  # type: ignore
+    elif cls is am.String:
+        return bool(expr.value)  # type: ignore
+    elif cls is am.Vector:
+        return bool(expr.vals)  # type: ignore
+    return True
+
+
 @make_function(BOOLEAN, "bool")
 def _bool(env: Environment, expr: am.Amalgam) -> am.Atom:
     """Checks for the truthiness of an :data:`expr`."""
-    if expr == am.String(""):
-        return am.Atom("FALSE")
-    elif expr == am.Numeric(0):
-        return am.Atom("FALSE")
-    elif expr == am.Vector():
-        return am.Atom("FALSE")
-    elif expr == am.Atom("FALSE"):
-        return am.Atom("FALSE")
-    elif expr == am.Atom("NIL"):
-        return am.Atom("FALSE")
-    return am.Atom("TRUE")
+    return TRUE if _is_true(expr) else FALSE
 
 
 @make_function(BOOLEAN, "not")
 def _not(env: Environment, expr: am.Amalgam) -> am.Atom:
     """Checks and negates the truthiness of :data:`expr`."""
-    if _bool(env, expr) == am.Atom("TRUE"):
-        return am.Atom("FALSE")
-    return am.Atom("TRUE")
+    return FALSE if _is_true(expr) else TRUE
 
 
 @make_function(BOOLEAN, "and", defer=True)
-def _and(env: Environment, *exprs: am.Amalgam) -> am.Atom:
+def _and(
+    env: Environment, *exprs: am.Amalgam, _is_true: Truthiness = _is_true,
+) -> am.Atom:
     """
     Checks the truthiness of the evaluated :data:`exprs` and performs
     an `and` operation. Short-circuits when :data:`:FALSE` is returned
     and does not evaluate subsequent expressions.
+
+    :func:`_is_true` is bound as a keyword-only default, here and in
+    :func:`_or`, making it a local lookup for each expression.
     """
     for expr in exprs:
-        cond = _bool(env, expr.evaluate(env))
-        if cond == am.Atom("FALSE"):
-            return cond
-    return am.Atom("TRUE")
+        if not _is_true(expr.evaluate(env)):
+            return FALSE
+    return TRUE
 
 
 @make_function(BOOLEAN, "or", defer=True)
-def _or(env: Environment, *exprs: am.Amalgam) -> am.Atom:
+def _or(
+    env: Environment, *exprs: am.Amalgam, _is_true: Truthiness = _is_true,
+) -> am.Atom:
     """
     Checks the truthiness of the evaluated :data:`exprs` and performs
     an `or` operation. Short-circuits when :data:`:TRUE` is returned
     and does not evaluate subsequent expressions.
     """
     for expr in exprs:
-        cond = _bool(env, expr.evaluate(env))
-        if cond == am.Atom("TRUE"):
-            return cond
-    return am.Atom("FALSE")
+        if _is_true(expr.evaluate(env)):
+            return TRUE
+    return FALSE
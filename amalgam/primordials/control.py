@@ -4,58 +4,77 @@ from typing import TYPE_CHECKING
 
 import amalgam.amalgams as am
 import amalgam.primordials.boolean as boolean
-from amalgam.primordials.utils import make_function
+from amalgam.primordials.utils import make_function, NIL
 
 
 if TYPE_CHECKING:  # pragma: no cover
     from amalgam.environment import Environment
+    from amalgam.primordials.boolean import Truthiness
     from amalgam.primordials.utils import Store
 
 
 CONTROL: Store = {}
 
 
+_PAYLOAD = am.Atom("payload")
+
+
 @make_function(CONTROL, "if", defer=True)
 def _if(
-    env: Environment, cond: am.Amalgam, then: am.Amalgam, else_: am.Amalgam,
+    env: Environment,
+    cond: am.Amalgam,
+    then: am.Amalgam,
+    else_: am.Amalgam,
+    *,
+    _is_true: Truthiness = boolean._is_true,
 ) -> am.Amalgam:
     """
     Checks the truthiness of the evaluated :data:`cond`, evaluates and
     returns :data:`then` if :data:`:TRUE`, otherwise, evaluates and
     returns :data:`else_`.
+
+    Like the other conditionals, binds :func:`.boolean._is_true` as a
+    keyword-only default, sparing a global and an attribute lookup on
+    every call.
     """
-    cond = boolean._bool(env, cond.evaluate(env))
-    if cond == am.Atom("TRUE"):
+    if _is_true(cond.evaluate(env)):
         return then.evaluate(env)
     return else_.evaluate(env)
 
 
 @make_function(CONTROL, "when", defer=True)
 def _when(
-    env: Environment, cond: am.Amalgam, body: am.Amalgam,
+    env: Environment,
+    cond: am.Amalgam,
+    body: am.Amalgam,
+    *,
+    _is_true: Truthiness = boolean._is_true,
 ) -> am.Amalgam:
     """
     Synonym for :func:`._if` that defaults :data:`else` to
     :data:`:NIL`.
     """
-    cond = boolean._bool(env, cond.evaluate(env))
-    if cond == am.Atom("TRUE"):
+    if _is_true(cond.evaluate(env)):
         return body.evaluate(env)
-    return am.Atom("NIL")
+    return NIL
 
 
 @make_function(CONTROL, "cond", defer=True)
-def _cond(env: Environment, *pairs: am.Vector[am.Amalgam]) -> am.Amalgam:
+def _cond(
+    env: Environment,
+    *pairs: am.Vector[am.Amalgam],
+    _is_true: Truthiness = boolean._is_true,
+) -> am.Amalgam:
     """
     Traverses pairs of conditions and values. If the condition evaluates
     to :data:`:TRUE`, returns the value pair and short-circuits
     evaluation. If no conditions are met, :data:`:NIL` is returned.
     """
     for pair in pairs:
-        pred, expr = pair
-        if boolean._bool(env, pred.evaluate(env)) == am.Atom("TRUE"):
+        pred, expr = pair.vals
+        if _is_true(pred.evaluate(env)):
             return expr.evaluate(env)
-    return am.Atom("NIL")
+    return NIL
 
 
 @make_function(CONTROL, "do", defer=True)
@@ -64,7 +83,7 @@ def _do(env: Environment, *exprs: am.Amalgam) -> am.Amalgam:
     Evaluates a variadic amount of :data:`exprs`, returning the final
     expression evaluated.
     """
-    accumulator: am.Amalgam = am.Atom("NIL")
+    accumulator: am.Amalgam = NIL
     for expr in exprs:
         accumulator = expr.evaluate(env)
     return accumulator
@@ -73,13 +92,13 @@ def _do(env: Environment, *exprs: am.Amalgam) -> am.Amalgam:
 @make_function(CONTROL, "return", contextual=True)
 def _return(env: Environment, result: am.Amalgam) -> am.Vector:
     """Exits a context with a :data:`result`."""
-    return am.Vector(am.Atom("payload"), result)
+    return am.Vector._from_vals((_PAYLOAD, result))
 
 
 @make_function(CONTROL, "break", contextual=True)
 def _break(env: Environment) -> am.Vector:
     """Exits a loop with :data:`:NIL`."""
-    return am.Vector(am.Atom("payload"), am.Atom("NIL"))
+    return am.Vector._from_vals((_PAYLOAD, NIL))
 
 
 @make_function(CONTROL, "loop", defer=True, allows=("break", "return"))
@@ -87,11 +106,17 @@ def _loop(env: Environment, *exprs: am.Amalgam) -> am.Amalgam:
     """
     Loops through and evaluates :data:`exprs` indefinitely until a
     :data:`break` or :data:`return` is encountered.
+
+    Results are tested for a payload before indexing into them, rather
+    than raising and catching an exception for every expression that
+    does not return one. The bound :meth:`.amalgams.Amalgam.evaluate`
+    of each expression is looked up once rather than per iteration.
     """
+    Vector = am.Vector
+    evaluators = tuple([expr.evaluate for expr in exprs])
+
     while True:
-        for expr in exprs:
-            result = expr.evaluate(env)
-            try:
+        for evaluate in evaluators:
+            result = evaluate(env)
+            if isinstance(result, Vector) and "payload" in result.mapping:
                 return result.mapping["payload"]
-            except (AttributeError, KeyError):
-                pass
@@ -133,4 +133,4 @@ def _let(
         names.append(name)
         values.append(value)
 
-    return _fn(env, am.Vector(*names), body).call(env, *values)
+    return _fn(env, am.Vector._from_vals(tuple(names)), body).call(env, *values)
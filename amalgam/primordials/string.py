@@ -16,5 +16,10 @@ STRING: Store = {}
 
 @make_function(STRING, "concat")
 def _concat(env: Environment, *strings: am.String) -> am.String:
-    """Concatenates the given :data:`strings`."""
-    return am.String("".join(string.value for string in strings))
+    """
+    Concatenates the given :data:`strings`, returning a single
+    :class:`.amalgams.String` as is.
+    """
+    if len(strings) == 1 and type(strings[0]) is am.String:
+        return strings[0]
+    return am.String("".join([string.value for string in strings]))
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from functools import partial, wraps
+import sys
 from typing import (
-    cast,
     overload,
     Callable,
     List,
@@ -25,6 +25,16 @@ if TYPE_CHECKING:  # pragma: no cover
 T = TypeVar("T", bound=am.Amalgam)
 
 
+TRUE = am.Atom("TRUE")
+"""The shared :data:`:TRUE` atom returned by the primordials."""
+
+FALSE = am.Atom("FALSE")
+"""The shared :data:`:FALSE` atom returned by the primordials."""
+
+NIL = am.Atom("NIL")
+"""The shared :data:`:NIL` atom returned by the primordials."""
+
+
 @overload
 def make_function(
     store: Store,
@@ -55,6 +65,15 @@ def make_function(
     """
     Transforms a :data:`func` into a :class:`.amalgams.Function` and
     places it inside of a :data:`store`.
+
+    The :data:`name` is interned like the identifiers produced by the
+    parser, letting binding lookups compare the two by identity.
+
+    A :data:`func` is only wrapped to enable the functions named in
+    :data:`allows` during its call, and is stored as is otherwise,
+    sparing most primordials an extra call on every use. The names in
+    :data:`allows` are resolved from :data:`store` once, on the first
+    call, rather than searched for in the calling environment.
     """
 
     if func is None:
@@ -67,15 +86,20 @@ def make_function(
             allows=allows,
         )
 
-    if allows is None:
-        allows = []
+    name = sys.intern(name)
+
+    if not allows:
+        store[name] = am.Function(name, func, defer, contextual)
+        return func
+
+    fns: List[am.Function] = []
 
     @wraps(func)
     def _func(
         env: Environment, *arguments: am.Amalgam, **keywords: am.Amalgam
     ) -> am.Amalgam:
-        with env.search_at(depth=-1):
-            fns = cast(List[am.Function], [env[allow] for allow in allows])
+        if not fns:
+            fns.extend(store[allow] for allow in allows)
 
         for fn in fns:
             fn.in_context = True
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from itertools import chain
-from typing import List, TYPE_CHECKING
+from typing import List, Mapping, Tuple, TYPE_CHECKING
 
 import amalgam.amalgams as am
-from amalgam.primordials.utils import make_function
+from amalgam.primordials.utils import make_function, FALSE, TRUE
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -17,8 +17,19 @@ VECTOR: Store = {}
 
 @make_function(VECTOR, "merge")
 def _merge(env: Environment, *vectors: am.Vector) -> am.Vector:
-    """Merges the given :data:`vectors`."""
-    return am.Vector(*chain.from_iterable(vectors))
+    """
+    Merges the given :data:`vectors`, returning a single
+    :class:`.amalgams.Vector` as is.
+    """
+    if len(vectors) == 1 and type(vectors[0]) is am.Vector:
+        return vectors[0]
+
+    vals: List[am.Amalgam] = []
+    extend = vals.extend
+    for vector in vectors:
+        extend(vector.vals)
+
+    return am.Vector._from_vals(tuple(vals))
 
 
 @make_function(VECTOR, "slice")
@@ -30,7 +41,7 @@ def _slice(
     step: am.Numeric = am.Numeric(1),
 ) -> am.Vector:
     """Returns a slice of the given :data:`vector`."""
-    return am.Vector(*vector.vals[start.value:stop.value:step.value])
+    return am.Vector._from_vals(vector.vals[start.value:stop.value:step.value])
 
 
 @make_function(VECTOR, "at")
@@ -41,10 +52,16 @@ def _at(env: Environment, index: am.Numeric, vector: am.Vector) -> am.Amalgam:
 
 @make_function(VECTOR, "remove")
 def _remove(env: Environment, index: am.Numeric, vector: am.Vector) -> am.Vector:
-    """Removes an item in :data:`vector` using :data:`index`."""
-    vals = list(vector)
-    del vals[index.value]
-    return am.Vector(*vals)
+    """
+    Removes an item in :data:`vector` using :data:`index`.
+
+    The :data:`index` is normalized through a :class:`range` first,
+    resolving negative indices and rejecting invalid ones like
+    a `del` statement would.
+    """
+    vals = vector.vals
+    i = range(len(vals))[index.value]
+    return am.Vector._from_vals(vals[:i] + vals[i + 1:])
 
 
 @make_function(VECTOR, "len")
@@ -56,39 +73,41 @@ def _len(env: Environment, vector: am.Vector) -> am.Numeric:
 @make_function(VECTOR, "cons")
 def _cons(env: Environment, amalgam: am.Amalgam, vector: am.Vector) -> am.Vector:
     """Preprends an :data:`amalgam` to :data:`vector`."""
-    return am.Vector(amalgam, *vector)
+    return am.Vector._from_vals((amalgam,) + vector.vals)
 
 
 @make_function(VECTOR, "snoc")
 def _snoc(env: Environment, vector: am.Vector, amalgam: am.Amalgam) -> am.Vector:
     """Appends an :data:`amalgam` to :data:`vector`."""
-    return am.Vector(*vector, amalgam)
+    return am.Vector._from_vals(vector.vals + (amalgam,))
 
 
 @make_function(VECTOR, "is-map")
 def _is_map(env: Environment, vector: am.Vector) -> am.Atom:
     """Verifies whether :data:`vector` is a mapping."""
     if vector.mapping:
-        return am.Atom("TRUE")
-    return am.Atom("FALSE")
+        return TRUE
+    return FALSE
 
 
 @make_function(VECTOR, "map-in")
 def _map_in(env: Environment, vector: am.Vector, atom: am.Atom) -> am.Atom:
     """Checks whether :data:`atom` is a member of :data:`vector`."""
-    if not vector.mapping:
+    mapping = vector.mapping
+    if not mapping:
         raise ValueError("the given vector is not a mapping")
-    if atom.value in vector.mapping:
-        return am.Atom("TRUE")
-    return am.Atom("FALSE")
+    if atom.value in mapping:
+        return TRUE
+    return FALSE
 
 
 @make_function(VECTOR, "map-at")
 def _map_at(env: Environment, vector: am.Vector, atom: am.Atom) -> am.Amalgam:
     """Obtains the value bound to :data:`atom` in :data:`vector`."""
-    if not vector.mapping:
+    mapping = vector.mapping
+    if not mapping:
         raise ValueError("the given vector is not a mapping")
-    return vector.mapping[atom.value]
+    return mapping[atom.value]
 
 
 @make_function(VECTOR, "map-up")
@@ -101,20 +120,41 @@ def _map_up(
     """
     Updates the :data:`vector mapping with :data:`atom`, and
     :data:`amalgam`.
+
+    Unless :data:`vector` repeats a key, the value of an existing key
+    is replaced at the position recorded for it, or a new pair is
+    appended, without rebuilding :attr:`.amalgams.Vector.vals` pair
+    by pair.
     """
-    if not vector.mapping:
+    mapping = vector.mapping
+    if not mapping:
         raise ValueError("the given vector is not a mapping")
 
     new_vector: am.Vector[am.Amalgam] = am.Vector()
 
-    mapping = {**vector.mapping}
-    mapping[atom.value] = amalgam
-
-    vals: List[am.Amalgam] = []
-    for name, value in mapping.items():
-        vals += (am.Atom(name), value)
-
-    new_vector.vals = tuple(vals)
+    mapping = {**mapping}
+    indices: Mapping[str, int] = vector._indices
+    vals: Tuple[am.Amalgam, ...] = vector.vals
+
+    if len(vals) != 2 * len(mapping):
+        mapping[atom.value] = amalgam
+        vals = tuple(
+            chain.from_iterable(
+                (am.Atom(name), value) for name, value in mapping.items()
+            )
+        )
+        indices = {name: 2 * index + 1 for index, name in enumerate(mapping)}
+    elif atom.value in mapping:
+        i = indices[atom.value]
+        mapping[atom.value] = amalgam
+        vals = vals[:i] + (amalgam,) + vals[i + 1:]
+    else:
+        mapping[atom.value] = amalgam
+        indices = {**indices, atom.value: len(vals) + 1}
+        vals = vals + (atom, amalgam)
+
+    new_vector.vals = vals
     new_vector.mapping = mapping
+    new_vector._indices = indices
 
     return new_vector
@@ -75,6 +75,28 @@ def test_symbol_evaluate(env):
     assert s == e
 
 
+def test_symbol_evaluate_inline_cache(env):
+    symbol = Symbol("x")
+
+    env["x"] = Numeric(21)
+    assert symbol.evaluate(env) == Numeric(21)
+
+    env["x"] = Numeric(42)
+    assert symbol.evaluate(env) == Numeric(42)
+
+    cl_env = env.env_push()
+    assert symbol.evaluate(cl_env) == Numeric(42)
+
+    cl_env["x"] = Numeric(63)
+    assert symbol.evaluate(cl_env) == Numeric(63)
+    assert symbol.evaluate(env) == Numeric(42)
+
+    del env["x"]
+
+    with raises(FailureStack):
+        symbol.evaluate(env)
+
+
 def test_vector_evaluate(env):
     vector = Vector(Symbol("+"), Numeric(42))
     assert vector.evaluate(env) == Vector(env["+"], Numeric(42))
@@ -97,6 +119,15 @@ def test_vector_mapping(env):
     assert v4.mapping == {"FOO": Numeric(42), "BAR": Numeric(42)}
 
 
+def test_vector_from_vals():
+    vals = (Atom("FOO"), Numeric(42))
+    vector = Vector._from_vals(vals)
+
+    assert vector.vals is vals
+    assert vector == Vector(*vals)
+    assert vector.mapping == {"FOO": Numeric(42)}
+
+
 def test_vector_iter():
     vector = Vector(Numeric(21), Numeric(42), Numeric(63))
     assert list(vector) == list(vector.vals)
@@ -112,6 +143,22 @@ def test_s_expression_evaluate(env):
     assert sexpr.evaluate(env) == Numeric(42)
 
 
+s_expression_arities = (
+    param(arity, id=f"arity-{arity}") for arity in range(6)
+)
+
+
+@mark.parametrize(("arity",), s_expression_arities)
+def test_s_expression_evaluate_arities(env, arity):
+    nums = [Numeric(n) for n in range(arity)]
+    sexpr = SExpression(Symbol("vector-test"), *nums)
+
+    env["vector-test"] = Function("vector-test", lambda _e, *_a: Vector(*_a))
+
+    assert sexpr.args == tuple(nums)
+    assert sexpr.evaluate(env) == Vector(*nums)
+
+
 def test_s_expression_evaluate_unresolved_head(env):
     sexpr = SExpression(Symbol("x"), Numeric(21), Numeric(21))
 
@@ -148,6 +195,15 @@ def test_s_expression_evaluate_invalid_context(env):
     ]
 
 
+def test_s_expression_from_vals():
+    vals = (Symbol("+"), Numeric(21), Numeric(21))
+    sexpr = SExpression._from_vals(vals)
+
+    assert sexpr.vals is vals
+    assert sexpr == SExpression(*vals)
+    assert sexpr.args == vals[1:]
+
+
 def test_s_expression_iter():
     sexpr = SExpression(Symbol("+"), Numeric(21), Numeric(21))
     assert list(sexpr) == list(sexpr.vals)
@@ -0,0 +1,112 @@
+from amalgam.amalgams import FailureStack
+from amalgam.bytecode import (
+    compile_to_bytecode,
+    execute,
+    CompilationError,
+    CALL,
+    CALL_DEFER,
+    RET,
+)
+from amalgam.engine import Engine
+import amalgam.parser as pr
+
+from pytest import fixture, mark, param, raises
+
+
+@fixture
+def env():
+    return Engine().environment
+
+
+programs = (
+    param(text, id=text)
+    for text in (
+        "42",
+        ":atom",
+        "\"string\"",
+        "'(+ 21 21)",
+        "(+ 21 21)",
+        "(+ (* 2 3) (- 10 (/ 8 2)))",
+        "[1 (+ 1 1) [3 (+ 2 2)]]",
+        "(if (> 2 1) (+ 1 1) (+ 2 2))",
+        "(do (setn x 21) (+ x x))",
+        "(let [[x 21] [y 21]] (+ x y))",
+        "((fn [x y] (+ x y)) 21 21)",
+        "(loop (return 42))",
+    )
+)
+
+
+@mark.parametrize(("text",), programs)
+def test_bytecode_matches_evaluate(text):
+    expected = pr.parse(text).evaluate(Engine().environment)
+    result = execute(compile_to_bytecode(pr.parse(text)), Engine().environment)
+
+    assert result == expected
+
+
+def test_bytecode_layout():
+    code = compile_to_bytecode(pr.parse("(+ 1 2)"))
+    ops = [op for op, _, _ in code]
+
+    assert ops.count(CALL) == 1
+    assert ops.count(CALL_DEFER) == 1
+    assert ops[-1] == RET
+
+
+def test_bytecode_empty_s_expression():
+    with raises(CompilationError):
+        compile_to_bytecode(pr.parse("()"))
+
+
+failures = (
+    param(text, id=text)
+    for text in (
+        "x",
+        "(+ x 1)",
+        "(+ 1 (+ 2 x))",
+        "(21 21)",
+        "[1 (+ 1 x)]",
+        "(return 42)",
+        "(setr 42 42)",
+        "(if x 1 2)",
+    )
+)
+
+
+@mark.parametrize(("text",), failures)
+def test_bytecode_failures_match_evaluate(env, text):
+    with raises(FailureStack) as expected:
+        pr.parse(text).evaluate(env)
+
+    with raises(FailureStack) as result:
+        execute(compile_to_bytecode(pr.parse(text)), env)
+
+    def unpack(failures):
+        return [(a, m) for a, _, m in failures.unpacked_failures]
+
+    assert unpack(result.value) == unpack(expected.value)
+
+
+def test_engine_code_cache():
+    engine = Engine()
+    engine._interpret("(+ 21 21)")
+
+    assert "(+ 21 21)" in engine.code_cache
+
+    with raises(IndexError):
+        engine._interpret("()")
+
+    assert "()" not in engine.code_cache
+
+
+def test_engine_code_cache_is_bounded(mocker):
+    mocker.patch("amalgam.engine.CODE_CACHE_SIZE", 2)
+
+    engine = Engine()
+    engine._interpret("(+ 1 1)")
+    engine._interpret("(+ 2 2)")
+    engine._interpret("(+ 1 1)")
+    engine._interpret("(+ 3 3)")
+
+    assert list(engine.code_cache) == ["(+ 1 1)", "(+ 3 3)"]
@@ -24,7 +24,9 @@ def test_invoke_expr():
     assert result.stdout == "84\n"
 
 
-def test_invoke_file():
+def test_invoke_file(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
     runner = CliRunner()
     with runner.isolated_filesystem():
         with open("plus.al", "w") as f:
@@ -1,5 +1,9 @@
+import subprocess
+import sys
+
 from amalgam.amalgams import Numeric
 from amalgam.engine import Engine
+from amalgam.primordials import FUNCTIONS
 
 from pytest import fixture, raises
 
@@ -11,7 +15,7 @@ def mock_prompt(mocker):
 
     MockClassPromptSession.return_value = MockSelfPromptSession
 
-    mocker.patch("amalgam.engine.PromptSession", MockClassPromptSession)
+    mocker.patch("prompt_toolkit.PromptSession", MockClassPromptSession)
 
     return MockSelfPromptSession.prompt
 
@@ -86,3 +90,34 @@ def test_engine_external_interpret(capsys):
     engine.interpret("(+ x x)")
 
     assert capsys.readouterr().err != ""
+
+
+def test_engine_cached_parse():
+    engine = Engine()
+    parse = engine._cached_parse
+
+    assert parse("(+ 21 21)") is parse("(+ 21 21)")
+    assert parse("(+ 21 21)", "<a>") is not parse("(+ 21 21)", "<b>")
+    assert parse("(+ 21 21)") is not Engine()._cached_parse("(+ 21 21)")
+
+
+def test_engine_does_not_import_prompt_toolkit():
+    code = "import sys, amalgam.engine; print('prompt_toolkit' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+    ).stdout
+
+    assert out == "False\n"
+
+
+def test_engine_bindings_are_isolated():
+    engine_a = Engine()
+    engine_b = Engine()
+
+    assert engine_a.environment.bindings is not FUNCTIONS
+    assert engine_a.environment.bindings is not engine_b.environment.bindings
+
+    engine_a.environment["x"] = Numeric(42)
+
+    assert "x" not in engine_b.environment
+    assert "x" not in FUNCTIONS
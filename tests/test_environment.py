@@ -27,6 +27,21 @@ def test_environment_copies_bindings():
     assert Environment(bindings).bindings is not bindings
 
 
+def test_environment_adopts_owned_bindings(flat_environment):
+    bindings = {"x": 21, "y": 42}
+    assert Environment(bindings, _owned=True).bindings is bindings
+    assert flat_environment.env_push(bindings, _owned=True).bindings is bindings
+    assert Environment(None, _owned=True).bindings == {}
+
+
+def test_environment_has_no_instance_dict(flat_environment):
+    assert not hasattr(flat_environment, "__dict__")
+
+
+def test_environment_serials_are_unique(flat_environment):
+    assert flat_environment.serial != flat_environment.env_push().serial
+
+
 def test_environment_increments_level(flat_environment):
     assert flat_environment.level == 0
     assert Environment(parent=flat_environment).level == 1
@@ -65,6 +80,40 @@ def test_environment_search_at(nested_environment):
             pass
 
 
+def test_environment_search_chain_follows_search_at(nested_environment):
+    assert len(list(nested_environment.search_chain)) == 1
+
+    with nested_environment.search_at(depth=-1):
+        assert len(list(nested_environment.search_chain)) == 3
+
+        with nested_environment.search_at(depth=1):
+            assert len(list(nested_environment.search_chain)) == 2
+
+        assert len(list(nested_environment.search_chain)) == 3
+
+    assert len(list(nested_environment.search_chain)) == 1
+
+
+def test_environment_search_at_without_with(nested_environment):
+    nested_environment.search_at(depth=-1)
+
+    assert nested_environment.search_depth == 0
+    assert len(list(nested_environment.search_chain)) == 1
+
+    with nested_environment.search_at(depth=1):
+        assert nested_environment.search_depth == 1
+    assert nested_environment.search_depth == 0
+
+
+def test_environment_search_at_nested(nested_environment):
+    with nested_environment.search_at(depth=-1):
+        with nested_environment.search_at(depth=1):
+            assert nested_environment.search_depth == 1
+        assert nested_environment.search_depth == -1
+        assert nested_environment["foo"] == 21
+    assert nested_environment.search_depth == 0
+
+
 def test_environment_getitem_immediate(flat_environment):
     assert flat_environment["foo"] == flat_environment.bindings["foo"]
 
@@ -174,3 +223,77 @@ def test_environment_contains_limited(nested_environment):
         assert "nul" in nested_environment
         assert "baz" in nested_environment
         assert "foo" not in nested_environment
+
+
+def test_environment_resolution_sees_new_bindings(nested_environment):
+    with nested_environment.search_at(depth=-1):
+        assert "new" not in nested_environment
+
+    nested_environment.parent.parent["new"] = 21
+
+    with nested_environment.search_at(depth=-1):
+        assert nested_environment["new"] == 21
+
+
+def test_environment_resolution_sees_shadowing(nested_environment):
+    with nested_environment.search_at(depth=-1):
+        assert nested_environment["foo"] == 21
+
+    nested_environment.parent["foo"] = 42
+
+    with nested_environment.search_at(depth=-1):
+        assert nested_environment["foo"] == 42
+        nested_environment["foo"] = 63
+
+    assert nested_environment.parent.bindings["foo"] == 63
+    assert nested_environment.parent.parent.bindings["foo"] == 21
+
+
+def test_environment_resolution_sees_deletions(nested_environment):
+    with nested_environment.search_at(depth=-1):
+        assert nested_environment["baz"] == 63
+
+    del nested_environment.parent["baz"]
+
+    with nested_environment.search_at(depth=-1):
+        assert "baz" not in nested_environment
+        with raises(KeyError):
+            nested_environment["baz"]
+
+
+def test_environment_resolution_sees_immediate_shadowing(nested_environment):
+    with nested_environment.search_at(depth=-1):
+        assert nested_environment["baz"] == 63
+
+    nested_environment["baz"] = 42
+
+    with nested_environment.search_at(depth=-1):
+        assert nested_environment["baz"] == 42
+
+    assert nested_environment.parent.bindings["baz"] == 63
+
+
+def test_environment_resolution_survives_fresh_bindings(nested_environment):
+    with nested_environment.search_at(depth=-1):
+        assert nested_environment["foo"] == 21
+
+    generation = Environment.generation
+    nested_environment["fresh"] = 42
+
+    assert Environment.generation == generation
+
+    with nested_environment.search_at(depth=-1):
+        assert nested_environment["fresh"] == 42
+        assert nested_environment["foo"] == 21
+
+
+def test_environment_resolution_sees_previously_unbound(nested_environment):
+    child = nested_environment.env_push()
+
+    with child.search_at(depth=-1):
+        assert "late" not in child
+
+    nested_environment["late"] = 42
+
+    with child.search_at(depth=-1):
+        assert child["late"] == 42
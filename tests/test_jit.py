@@ -0,0 +1,128 @@
+import gc
+
+from amalgam.amalgams import create_fn, FailureStack, Numeric
+from amalgam.engine import Engine
+from amalgam.jit import compile_closure, HOT_THRESHOLD
+import amalgam.parser as pr
+
+from pytest import fixture, mark, param, raises
+
+
+@fixture
+def env():
+    return Engine().environment
+
+
+programs = (
+    param(text, id=text)
+    for text in (
+        "42",
+        "(+ 21 21)",
+        "(+ (* 2 3) (- 10 (/ 8 2)))",
+        "[1 (+ 1 1) [3 (+ 2 2)]]",
+        "(if (> 2 1) (+ 1 1) (+ 2 2))",
+        "(let [[x 21] [y 21]] (+ x y))",
+        "((fn [x y] (+ x y)) 21 21)",
+    )
+)
+
+
+@mark.parametrize(("text",), programs)
+def test_compile_closure_matches_evaluate(env, text):
+    expected = pr.parse(text).evaluate(env)
+    assert compile_closure(pr.parse(text))(env) == expected
+
+
+failures = (
+    param(text, id=text)
+    for text in (
+        "x",
+        "(+ x 1)",
+        "(+ 1 (+ 2 x))",
+        "(21 21)",
+        "[1 (+ 1 x)]",
+        "(return 42)",
+        "(setr 42 42)",
+    )
+)
+
+
+@mark.parametrize(("text",), failures)
+def test_compile_closure_failures_match_evaluate(env, text):
+    with raises(FailureStack) as expected:
+        pr.parse(text).evaluate(env)
+
+    with raises(FailureStack) as result:
+        compile_closure(pr.parse(text))(env)
+
+    def unpack(failures):
+        return [(a, m) for a, _, m in failures.unpacked_failures]
+
+    assert unpack(result.value) == unpack(expected.value)
+
+
+def heat(env, body, *arguments):
+    function = create_fn("heat", [f"x{i}" for i in range(len(arguments))], body)
+    return [function.call(env, *arguments) for _ in range(HOT_THRESHOLD)]
+
+
+def test_hot_function_body_is_compiled(env):
+    body = pr.parse("(+ x0 21)")
+    hot_spots = env.engine.hot_spots
+    function = create_fn("add", ["x0"], body)
+
+    for _ in range(HOT_THRESHOLD - 1):
+        function.call(env, Numeric(21))
+
+    assert id(body) not in hot_spots.compiled
+
+    function.call(env, Numeric(21))
+
+    assert hot_spots.compiled[id(body)][0] is body
+    assert function.call(env, Numeric(21)) == Numeric(42)
+
+
+def test_s_expression_outside_function_is_not_counted(env):
+    s_expression = pr.parse("(+ 21 21)")
+
+    for _ in range(HOT_THRESHOLD):
+        s_expression.evaluate(env)
+
+    assert id(s_expression) not in env.engine.hot_spots.hits
+    assert id(s_expression) not in env.engine.hot_spots.compiled
+
+
+def test_hot_function_body_is_not_modified(env):
+    body = pr.parse("(+ x0 21)")
+    attributes = dict(vars(body))
+
+    heat(env, body, Numeric(21))
+
+    assert vars(body) == attributes
+    assert id(body) not in Engine().hot_spots.compiled
+
+
+def test_hot_function_body_is_kept_alive(env):
+    for i in range(HOT_THRESHOLD):
+        body = pr.parse(f"(* {i} 3)")
+        assert heat(env, body)[-1] == Numeric(i * 3)
+        del body
+        gc.collect()
+
+
+def test_hot_function_body_failures_match_evaluate(env):
+    body = pr.parse("(+ 1 (+ 2 x))")
+    function = create_fn("fail", [], body)
+
+    def unpack():
+        with raises(FailureStack) as result:
+            function.call(env)
+        return [(a, m) for a, _, m in result.value.unpacked_failures]
+
+    expected = unpack()
+
+    for _ in range(HOT_THRESHOLD):
+        unpack()
+
+    assert id(body) in env.engine.hot_spots.compiled
+    assert unpack() == expected
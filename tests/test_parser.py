@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 import amalgam.parser as pr
 
 from pytest import mark, param, raises
@@ -25,6 +29,7 @@ strings = (
         (_as_string(_escaped_characters), "escaped-characters"),
         (_as_string("\\\\"), "escaped-backslash"),
         (_as_string("\\\""), "escaped-quotes"),
+        (_as_string(""), "empty-string"),
     )
 )
 
@@ -35,6 +40,29 @@ def test_string_parser(string):
     assert _as_string(parsed.value) == str(parsed)
 
 
+def test_string_parser_trailing_escaped_quote():
+    assert pr.parse(r'"spam\""').value == r'spam\"'
+
+
+unescapes = (
+    param(text, expected, id=identity)
+    for text, expected, identity in (
+        ("spam", "spam", "no-backslashes"),
+        (r"sp\am", "spam", "escaped-letter"),
+        (r"\s\p\am", "spam", "consecutive-escapes"),
+        (r"spam\\n", r"spam\\n", "escaped-backslash"),
+        (r"spam\"", r"spam\"", "escaped-quote"),
+        (r"spam\\\n", r"spam\\\n", "backslash-after-backslash"),
+        ("spam\\", "spam\\", "trailing-backslash"),
+    )
+)
+
+
+@mark.parametrize(("text", "expected"), unescapes)
+def test_unescape(text, expected):
+    assert pr._unescape(text) == expected
+
+
 numerics = (
     param(numeric, id=expr_id)
     for numeric, expr_id in (
@@ -126,3 +154,109 @@ norm_failures = (
 def test_parser_parse_raises(text, error):
     with raises(error):
         pr.parse(text)
+
+
+def test_parser_parse_raises_without_reparsing_examples(mocker):
+    with raises(pr.MissingClosing):
+        pr.parse("(spam")
+
+    spy = mocker.spy(pr.EXPR_PARSER, "parse")
+
+    with raises(pr.MissingClosing):
+        pr.parse("(eggs")
+
+    spy.assert_called_once_with("(eggs")
+
+
+def test_identifiers_are_interned():
+    s_expression = pr.parse("(spam-eggs :spam-eggs spam-eggs :spam-eggs)")
+    fst_symbol, fst_atom, snd_symbol, snd_atom = s_expression.vals
+
+    assert fst_symbol.value is snd_symbol.value
+    assert fst_atom.value is snd_atom.value
+
+
+def test_parser_locations():
+    s_expression = pr.parse("(+ 1\n   :spam)")
+    symbol, numeric, atom = s_expression.vals
+
+    assert s_expression.line_span == (1, 2)
+    assert s_expression.column_span == (1, 10)
+
+    assert symbol.line_span == (1, 1)
+    assert symbol.column_span == (2, 3)
+
+    assert numeric.line_span == (1, 1)
+    assert numeric.column_span == (4, 5)
+
+    assert atom.line_span == (2, 2)
+    assert atom.column_span == (4, 9)
+
+
+def test_fractions_are_shared():
+    s_expression = pr.parse("(+ 21/42 21/42)")
+    _, fst_fraction, snd_fraction = s_expression.vals
+
+    assert fst_fraction.value is snd_fraction.value
+    assert fst_fraction.line_span == snd_fraction.line_span
+    assert fst_fraction.column_span != snd_fraction.column_span
+
+
+scans = (
+    param(lines, expected, id=identity)
+    for lines, expected, identity in (
+        (("(+ 1 2)",), (0, False), "closed"),
+        (("(+ 1", "2 3)"), (0, False), "closed-on-continuation"),
+        (("[1 (2", "3"), (2, False), "nested-open"),
+        (("(concat \"(", "[\")"), (0, False), "brackets-in-string"),
+        (("\"foo \\\"", "bar"), (0, True), "escaped-quote"),
+        (("(+ 1 2))",), (-1, False), "extra-closing"),
+    )
+)
+
+
+@mark.parametrize(("lines", "expected"), scans)
+def test_scan_openings(lines, expected):
+    depth, in_string = 0, False
+    for line in lines:
+        depth, in_string = pr.scan_openings(line, depth, in_string)
+    assert (depth, in_string) == expected
+
+
+def test_default_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert pr.default_cache_dir() == tmp_path / "amalgam"
+
+
+def test_parser_tables_are_cached(tmp_path):
+    code = "import amalgam.parser as pr; print(pr.parse('(+ 21 21)'))"
+    env = {**os.environ, "XDG_CACHE_HOME": str(tmp_path)}
+
+    def run():
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True, env=env,
+        ).stdout
+
+    assert run() == "(+ 21 21)\n"
+
+    cached = list((tmp_path / "amalgam").glob("grammar-*.lark"))
+    assert len(cached) == 1
+
+    assert run() == "(+ 21 21)\n"
+
+    cached[0].write_bytes(b"corrupted")
+
+    assert run() == "(+ 21 21)\n"
+
+
+def test_parser_is_created_lazily():
+    code = (
+        "import amalgam.parser as pr; print(pr._EXPR_PARSER is None); "
+        "pr.parse('42'); print(pr._EXPR_PARSER is pr.EXPR_PARSER)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+    ).stdout
+
+    assert out == "True\nTrue\n"
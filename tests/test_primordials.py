@@ -1,4 +1,5 @@
 from fractions import Fraction
+import sys
 
 from amalgam.amalgams import (
     Atom,
@@ -56,7 +57,9 @@ from amalgam.primordials import (
     _unquote,
     _setr,
     _macro,
+    FUNCTIONS,
 )
+from amalgam.primordials.boolean import _is_true
 
 from pytest import fixture, mark, param, raises
 
@@ -66,6 +69,16 @@ def env():
     return Engine().environment
 
 
+def test_function_names_are_interned():
+    for name in FUNCTIONS:
+        assert sys.intern("".join(name)) is name
+
+
+def test_functions_without_allows_are_unwrapped():
+    assert FUNCTIONS["+"].fn is _add
+    assert hasattr(FUNCTIONS["loop"].fn, "__wrapped__")
+
+
 arithmetics = (
     param(
         arith_fn,
@@ -74,12 +87,16 @@ arithmetics = (
         id=f"({arith_op} {' '.join(map(str, arith_nm))})"
     )
     for arith_fn, arith_op, arith_nm, arith_rs in (
+        (_add, "+", (), 0),
         (_add, "+", (1, 2), 1 + 2),
         (_add, "+", (1, 2, 3), 1 + 2 + 3),
+        (_sub, "-", (5,), 5),
         (_sub, "-", (5, 3), 5 - 3),
         (_sub, "-", (3, 5, 3), 3 - (5 + 3)),
+        (_mul, "*", (), 1),
         (_mul, "*", (2, 2), 2 * 2),
         (_mul, "*", (2, 2, 2), 2 * 2 * 2),
+        (_div, "/", (4,), 4),
         (_div, "/", (4, 2), 4 / 2),
         (_div, "/", (6, 2, 3), 6 / (2 * 3)),
     )
@@ -179,6 +196,8 @@ _truthy_falsy = (
     (String("a"), _t, _f, "non-empty-string"),
     (Numeric(0), _f, _t, "zero-value"),
     (Numeric(1), _t, _f, "non-zero-value"),
+    (Numeric(0.0), _f, _t, "zero-float-value"),
+    (Numeric(Fraction(0)), _f, _t, "zero-fraction-value"),
     (Vector(), _f, _t, "empty-vector"),
     (Vector(Numeric(1)), _t, _f, "non-empty-vector"),
     (Atom("FALSE"), _f, _t, "false-atom"),
@@ -193,6 +212,12 @@ bools = (
 )
 
 
+is_trues = (
+    param(true_expr, bool_rslt == _t, id=true_iden)
+    for true_expr, bool_rslt, _, true_iden in _truthy_falsy
+)
+
+
 nots = (
     param(not_expr, not_rlst, id=not_iden)
     for not_expr, _, not_rlst, not_iden in _truthy_falsy
@@ -204,9 +229,14 @@ def test_bool(env, bool_expr, bool_rslt):
     assert _bool(env, bool_expr) == bool_rslt
 
 
+@mark.parametrize(("true_expr", "true_rslt"), is_trues)
+def test_is_true(true_expr, true_rslt):
+    assert _is_true(true_expr) is true_rslt
+
+
 @mark.parametrize(("not_expr", "not_rslt"), nots)
 def test_not(env, not_expr, not_rslt):
-    return _not(env, not_expr) == not_rslt
+    assert _not(env, not_expr) == not_rslt
 
 
 _four = Numeric(4)
@@ -239,6 +269,12 @@ def test_comp(env, comp_func, comp_x, comp_y, comp_rslt):
     assert comp_func(env, comp_x, comp_y) == comp_rslt
 
 
+def test_boolean_atoms_are_shared(env):
+    assert _eq(env, _five, _five) is _bool(env, _five)
+    assert _eq(env, _four, _five) is _not(env, _five)
+    assert _when(env, _eq(env, _four, _five), _five) is _do(env)
+
+
 def test_and(env):
     exprs = (
         SExpression(Symbol("setn"), Symbol("x"), Atom("TRUE")),
@@ -378,6 +414,17 @@ def test_putstrln(capsys, env):
     assert capsys.readouterr().out == "hello, world\n"
 
 
+def test_putstrln_string_subclass(capsys, env):
+    class Text(String):
+        def evaluate(self, _environment):
+            return self
+
+    text = Text("hello, world")
+
+    assert _putstrln(env, text) is text
+    assert capsys.readouterr().out == "hello, world\n"
+
+
 def test_do(capsys, env):
     exprs = (
         SExpression(Symbol("setn"), Symbol("x"), Numeric(21)),
@@ -398,6 +445,10 @@ def test_concat(env):
     s0 = String("hello")
     s1 = String("world")
     assert _concat(env, s0, s1) == String(s0.value + s1.value)
+    assert _concat(env, s0) is s0
+
+    with raises(AttributeError):
+        _concat(env, Vector(Numeric(1), Numeric(2)))
 
 
 def test_merge(env):
@@ -414,6 +465,11 @@ def test_merge(env):
     assert m1.vals == v0.vals + v2.vals
     assert m1.mapping == {}
 
+    assert _merge(env, v0) is v0
+
+    with raises(AttributeError):
+        _merge(env, String("foo"))
+
 
 def test_slice(env):
     v0 = Vector(
@@ -476,6 +532,16 @@ def test_remove(env):
     assert r1.mapping == {"bar": Numeric(42)}
 
 
+def test_remove_negative_index(env):
+    v0 = Vector(Atom("foo"), Numeric(21), Atom("bar"))
+
+    assert _remove(env, Numeric(-1), v0).vals == v0.vals[:-1]
+    assert _remove(env, Numeric(-2), v0).vals == v0.vals[::2]
+
+    with raises(IndexError):
+        _remove(env, Numeric(3), v0)
+
+
 def test_len(env):
     assert _len(env, Vector(Numeric(21), Numeric(42))) == Numeric(2)
 
@@ -524,6 +590,32 @@ def test_map_up(env, vector_mapping, vector_sequence):
         _map_up(env, vector_sequence, Atom("baz"), Numeric(63))
 
 
+def test_map_up_repeated_keys(env):
+    v0 = Vector(
+        Atom("foo"), Numeric(21), Atom("bar"), Numeric(42), Atom("foo"), Numeric(63),
+    )
+
+    v1 = _map_up(env, v0, Atom("bar"), Numeric(84))
+
+    assert v1.vals == (Atom("foo"), Numeric(63), Atom("bar"), Numeric(84))
+    assert v1.mapping == {"foo": Numeric(63), "bar": Numeric(84)}
+    assert v1._indices == {"foo": 1, "bar": 3}
+
+
+def test_map_up_tracks_positions(env):
+    v0 = Vector(Atom("foo"), Numeric(21), Atom("bar"), Numeric(42))
+
+    v1 = _map_up(env, v0, Atom("baz"), Numeric(63))
+    v2 = _map_up(env, v1, Atom("foo"), Numeric(84))
+    v3 = _map_up(env, v2, Atom("baz"), Numeric(105))
+
+    assert v3.vals == (
+        Atom("foo"), Numeric(84), Atom("bar"), Numeric(42), Atom("baz"), Numeric(105),
+    )
+    assert v3.mapping == {"foo": Numeric(84), "bar": Numeric(42), "baz": Numeric(105)}
+    assert v3._indices == Vector(*v3.vals)._indices == {"foo": 1, "bar": 3, "baz": 5}
+
+
 def test_loop_return(env):
     env["x"] = Numeric(0)
     looped = SExpression(